@@ -0,0 +1,195 @@
+"""
+Dashboard role (Pygame + PyImgui). The GUI stack is imported when the
+role starts, so importing this module stays cheap.
+"""
+
+import contextlib
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+
+from adsb_map import run_map_process
+from plane_cache import PlaneAttrCache
+from startup_profile import StartupProfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+# -------------------------
+# Dashboard (Pygame + PyImgui)
+# -------------------------
+def run_dashboard(shared_planes, backend="pygame", max_frames=None, timings=False, profile=False,
+                  startup=None):
+    startup = startup or StartupProfile("dashboard")
+    with startup.phase("import"):
+        import imgui
+        import numpy as np
+        from shared import imgui_compat as compat
+        from shared.app_runner import AppRunner, BACKENDS, FrameTimer
+        from shared.ui_recorder import UIRecorder
+
+    width, height = 1000, 750  # window sizes
+    with startup.phase("init"):
+        if backend == "null":
+            app_backend = BACKENDS["null"](width, height, max_frames=max_frames)
+        else:
+            app_backend = BACKENDS[backend](width, height, title="ADS-B Dashboard")
+
+    # -------------------------
+    # State
+    # -------------------------
+    histories = {}
+    plane_attrs = PlaneAttrCache()
+    selected_planes = []
+    map_process = None
+
+    def sync_histories():
+        items = list(shared_planes.items())
+        live = {hexid for hexid, _ in items}
+        # Planes that left the store go from the cache, histories and selection together
+        plane_attrs.sync(live)
+        for hexid in [h for h in histories if h not in live]:
+            del histories[hexid]
+        if any(hexid not in live for hexid in selected_planes):
+            selected_planes[:] = [hexid for hexid in selected_planes if hexid in live]
+        for hexid, rec in items:
+            if hexid not in histories:
+                histories[hexid] = {
+                    'alt': deque([0.0]*200, maxlen=200),
+                    'vel': deque([0.0]*200, maxlen=200),
+                    'ts': deque([0.0]*200, maxlen=200),
+                    'callsign': rec.get('callsign', hexid)
+                }
+            else:
+                histories[hexid]['callsign'] = rec.get('callsign', histories[hexid]['callsign'])
+
+    def update_histories():
+        for hexid, rec in list(shared_planes.items()):
+            h = histories.get(hexid)
+            if h:
+                h['alt'].append(float(rec.get('alt',0.0)))
+                h['vel'].append(float(rec.get('vel',0.0)))
+                h['ts'].append(float(rec.get('ts',time.time())))
+
+    def start_map_process():
+        process = multiprocessing.Process(target=run_map_process,
+                                          args=(shared_planes, StartupProfile("map")),
+                                          daemon=True)
+        process.start()
+        return process
+
+    def auto_select_top_n(n=3):
+        items = sorted(shared_planes.items(), key=lambda kv: kv[1].get('ts',0.0), reverse=True)
+        return [kv[0] for kv in items[:n]]
+
+    selected_planes = auto_select_top_n(3)
+
+    # -------------------------
+    # Frame
+    # -------------------------
+    def render_frame(runner):
+        nonlocal selected_planes, map_process
+
+        sync_histories()
+        update_histories()
+
+        # ---------- Menu Bar ----------
+        if imgui.begin_main_menu_bar():
+            if imgui.begin_menu("File", True):
+                if imgui.menu_item("Open Map")[0]:
+                    if map_process is None or not map_process.is_alive():
+                        map_process = start_map_process()
+                if imgui.menu_item("Refresh Map")[0]:
+                    if map_process and map_process.is_alive():
+                        map_process.terminate()
+                    map_process = start_map_process()
+                if imgui.menu_item("Quit")[0]:
+                    runner.request_close()
+                imgui.end_menu()
+            imgui.end_main_menu_bar()
+
+        # ---------- Dashboard Columns ----------
+        imgui.begin("ADS-B Dashboard")
+
+        compat.columns(2, "dashboard_cols", True)
+        col1_width = 400  # left: plane list + stats
+        col2_width = 580  # right: plots
+        compat.set_column_width(0, col1_width)
+
+        # ---------- Left Column: Plane List ----------
+        imgui.begin_child("plane_list_child", width=col1_width, height=700, border=True)
+        imgui.text("Tracked Planes")
+        imgui.separator()
+
+        # Plane checkboxes
+        items_sorted = sorted(shared_planes.items(), key=lambda kv: kv[1].get('ts',0.0), reverse=True)
+        for hexid, rec in items_sorted[:500]:
+            attrs = plane_attrs.get(hexid, rec.get('callsign'))
+            selected = hexid in selected_planes
+            changed, val = imgui.checkbox(attrs.label, selected)
+            if changed:
+                if val and hexid not in selected_planes:
+                    selected_planes.append(hexid)
+                elif not val and hexid in selected_planes:
+                    selected_planes.remove(hexid)
+
+        imgui.separator()
+        imgui.text(f"Total planes tracked: {len(shared_planes)}")
+        imgui.text(f"Selected planes: {len(selected_planes)}")
+        imgui.end_child()
+
+        compat.next_column()
+
+       # ---------- Right Column: Fixed-size Plots ----------
+        imgui.begin_child("plane_plots_child", width=col2_width, height=700, border=True)
+        imgui.text("Selected Plane Data")
+        imgui.separator()
+
+        if imgui.button("Auto-select top 3"):
+            selected_planes = auto_select_top_n(3)
+        imgui.same_line()
+        if imgui.button("Clear selection"):
+            selected_planes = []
+
+        for hexid in selected_planes:
+            h = histories.get(hexid)
+            if not h:
+                continue
+            attrs = plane_attrs.get(hexid, h.get('callsign'))
+            imgui.text(attrs.label)
+            imgui.spacing()
+            # Fixed-size plots
+            imgui.plot_lines(attrs.alt_title, np.array(h['alt'], dtype=np.float32), graph_size=(550, 180))
+            imgui.plot_lines(attrs.vel_title, np.array(h['vel'], dtype=np.float32), graph_size=(550, 140))
+            imgui.separator()
+            imgui.spacing()
+
+        imgui.end_child()
+        compat.columns(1)
+        imgui.end()
+
+    # -------------------------
+    # Main loop
+    # -------------------------
+    def report_startup(stats):
+        if stats.index == 0:
+            startup.mark("first frame")
+            startup.report()
+
+    recorder = UIRecorder(imgui, compat, capture_values=False) if profile else None
+    timer = FrameTimer() if timings or backend == "null" else None
+    runner = AppRunner(app_backend, recorder.wrap(render_frame) if recorder else render_frame,
+                       target_fps=None if backend == "null" else 30,
+                       clear_color=(0.95, 0.95, 0.95, 1.0),
+                       frame_hooks=[timer, report_startup] if timer else [report_startup])
+    with recorder or contextlib.nullcontext():
+        runner.run()
+    if timer:
+        print(timer.summary())
+    if profile:
+        print(recorder.stream.format_profile())
+
+    # Cleanup
+    if map_process and map_process.is_alive():
+        map_process.terminate()
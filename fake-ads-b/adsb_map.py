@@ -0,0 +1,76 @@
+"""
+Live map role (PyQt6 + Folium). Qt and Folium are imported when the role
+starts, never by the other roles.
+"""
+
+import sys
+
+from plane_cache import PlaneAttrCache
+from startup_profile import StartupProfile
+
+# -------------------------
+# Map process (PyQt6 + Folium)
+# -------------------------
+def run_map_process(shared_planes, startup=None):
+    startup = startup or StartupProfile("map")
+    with startup.phase("import"):
+        from PyQt6.QtWidgets import QApplication, QMainWindow
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+        from PyQt6.QtCore import QTimer
+        import folium
+        from io import BytesIO
+
+    class MapWindow(QMainWindow):
+        def __init__(self, shared):
+            super().__init__()
+            self.shared = shared
+            self.setWindowTitle("Live ADS-B Map")
+            self.resize(900, 750)
+            self.web = QWebEngineView()
+            self.setCentralWidget(self.web)
+
+            self.center = [20, 0]  # initial map center
+            self.plane_attrs = PlaneAttrCache()
+            self.update_map()      # create map once
+
+            # Update map every 30 seconds
+            self.timer = QTimer(self)
+            self.timer.timeout.connect(self.update_map)
+            self.timer.start(30000)
+
+        def update_map(self):
+            items = list(self.shared.items())
+            self.plane_attrs.sync({hexid for hexid, _ in items})
+            if items:
+                lats = [v['lat'] for _, v in items if v.get('lat') is not None]
+                lons = [v['lon'] for _, v in items if v.get('lon') is not None]
+                if lats and lons:
+                    avg_lat = sum(lats)/len(lats)
+                    avg_lon = sum(lons)/len(lons)
+                    # Only recenter if plane moves far (>5 degrees)
+                    if abs(avg_lat - self.center[0]) > 5 or abs(avg_lon - self.center[1]) > 5:
+                        self.center = [avg_lat, avg_lon]
+
+            # Create map at fixed/smooth center
+            m = folium.Map(location=self.center, zoom_start=5)
+
+            # Add plane markers
+            for hexid, rec in items[:300]:
+                lat, lon = rec.get('lat'), rec.get('lon')
+                if lat is None or lon is None:
+                    continue
+                attrs = self.plane_attrs.get(hexid, rec.get('callsign'))
+                popup = f"{attrs.popup_head}alt: {rec.get('alt',0.0)} m<br>vel: {rec.get('vel',0.0)} m/s"
+                folium.CircleMarker(location=[lat, lon], radius=4, color=attrs.color, fill=True, fill_color=attrs.color, popup=popup).add_to(m)
+
+            data = BytesIO()
+            m.save(data, close_file=False)
+            self.web.setHtml(data.getvalue().decode())
+
+    with startup.phase("init"):
+        app = QApplication(sys.argv)
+        win = MapWindow(shared_planes)
+        win.show()
+    startup.mark("first map")
+    startup.report()
+    app.exec()
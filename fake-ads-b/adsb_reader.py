@@ -0,0 +1,34 @@
+"""
+Fake ADS-B reader role. Imports nothing beyond the standard library.
+"""
+
+import time
+
+from startup_profile import StartupProfile
+
+# -------------------------
+# ADS-B fake reader (for testing)
+# -------------------------
+def run_fake_adsb_reader(shared_planes, startup=None):
+    startup = startup or StartupProfile("reader")
+    with startup.phase("import"):
+        import random
+    startup.mark("ready")
+
+    published = False
+    while True:
+        for i in range(5):
+            hexid = f"AB{i:03d}"
+            shared_planes[hexid] = {
+                "callsign": f"PLN{i:03d}",
+                "lat": random.uniform(-90, 90),
+                "lon": random.uniform(-180, 180),
+                "alt": random.uniform(1000, 10000),
+                "vel": random.uniform(100, 300),
+                "ts": time.time()
+            }
+        if not published:
+            published = True
+            startup.mark("first publish")
+            startup.report()
+        time.sleep(1)
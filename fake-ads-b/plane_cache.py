@@ -0,0 +1,62 @@
+"""
+Per-aircraft static attributes, cached by hexid.
+
+Colour, display labels, plot titles and the popup header only depend on
+the hexid and callsign, so they are built once per plane instead of on
+every frame or map refresh. An entry is rebuilt when the plane's callsign
+changes and evicted once the plane leaves the plane store.
+
+Colours come from a CRC of the hexid: stable across processes and runs,
+and independent of the global `random` state.
+"""
+
+import zlib
+from collections import namedtuple
+
+
+PlaneAttrs = namedtuple("PlaneAttrs", "hexid callsign color label alt_title vel_title popup_head")
+
+
+def plane_color(hexid):
+    """Generate a consistent color per plane."""
+    return "#{:06x}".format(zlib.crc32(hexid.encode()) & 0xFFFFFF)
+
+
+class PlaneAttrCache:
+    """
+    Static attributes per hexid. `get` returns the cached entry, building
+    it on first use or when the callsign differs; `sync` evicts planes
+    that are no longer tracked.
+    """
+    def __init__(self):
+        self._attrs = {}
+
+    def __len__(self):
+        return len(self._attrs)
+
+    def __contains__(self, hexid):
+        return hexid in self._attrs
+
+    def get(self, hexid, callsign=None):
+        callsign = callsign or hexid
+        attrs = self._attrs.get(hexid)
+        if attrs is None or attrs.callsign != callsign:
+            attrs = self._attrs[hexid] = PlaneAttrs(
+                hexid=hexid,
+                callsign=callsign,
+                color=plane_color(hexid),
+                label=f"{callsign} ({hexid})",
+                alt_title=f"Altitude (m) - {hexid}",
+                vel_title=f"Velocity (m/s) - {hexid}",
+                popup_head=f"{callsign}<br>",
+            )
+        return attrs
+
+    def sync(self, hexids):
+        """
+        Evicts every cached plane whose hexid is not in `hexids`.
+        """
+        if not isinstance(hexids, (set, frozenset, dict)):
+            hexids = set(hexids)
+        for hexid in [h for h in self._attrs if h not in hexids]:
+            del self._attrs[hexid]
@@ -0,0 +1,70 @@
+"""
+Startup-time instrumentation for the ADS-B process roles.
+
+Each role (reader, dashboard, map) gets a StartupProfile. `origin` is the
+wall-clock time the role was launched: the spawn time for child
+processes, module start for the main process. Interpreter start-up
+before that point is not covered. Roles time their imports and
+initialisation with `phase`, `mark` milestones such as the first
+published plane or the first rendered frame, and `report` once start-up
+is done.
+
+Reports are printed when ADSB_STARTUP_PROFILE is set in the environment
+(the variable is inherited by every child process). They are also stored
+under the role name in `sink`, a Manager dict, when one is given.
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+PROFILE_ENV = "ADSB_STARTUP_PROFILE"
+
+# Modules only the GUI roles should ever load
+HEAVY_MODULES = ("pygame", "OpenGL", "imgui", "numpy", "PyQt6", "folium")
+
+
+class StartupProfile:
+    def __init__(self, role, origin=None, sink=None, enabled=None):
+        self.role = role
+        self.origin = time.time() if origin is None else origin
+        self.sink = sink
+        self.enabled = bool(os.environ.get(PROFILE_ENV)) if enabled is None else enabled
+        self.phases = []
+        self.marks = []
+        self._reported = False
+
+    @contextmanager
+    def phase(self, label):
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.phases.append((label, time.time() - start))
+
+    def mark(self, label):
+        self.marks.append((label, time.time() - self.origin))
+
+    def report(self):
+        """
+        Publishes the profile once; later calls are ignored.
+        """
+        if self._reported:
+            return
+        self._reported = True
+
+        heavy = [name for name in HEAVY_MODULES if name in sys.modules]
+        if self.enabled:
+            phases = ", ".join(f"{label} {seconds * 1000.0:.1f} ms" for label, seconds in self.phases)
+            marks = ", ".join(f"{label} at {seconds * 1000.0:.1f} ms" for label, seconds in self.marks)
+            print(f"[startup:{self.role}] pid {os.getpid()}: {phases}; {marks}; "
+                  f"{len(sys.modules)} modules loaded, heavy: {', '.join(heavy) or 'none'}",
+                  flush=True)
+        if self.sink is not None:
+            self.sink[self.role] = {
+                "phases": dict(self.phases),
+                "marks": dict(self.marks),
+                "heavy_modules": heavy,
+            }
@@ -9,31 +9,16 @@ Complete ImGui + GLFW example containing:
 All widget calls happen inside the frame. State variables are defined up top.
 """
 
+import argparse
+import contextlib
+import os
 import sys
 import imgui
-from imgui.integrations.glfw import GlfwRenderer
-import glfw
-import OpenGL.GL as gl
 
-
-def initialize_glfw(width=800, height=600, title="ImGui + GLFW Example"):
-    if not glfw.init():
-        raise Exception("Could not initialize GLFW")
-
-    # Optional: request a core profile context if needed for your GL bindings
-    glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, 3)
-    glfw.window_hint(glfw.CONTEXT_VERSION_MINOR, 3)
-    glfw.window_hint(glfw.OPENGL_PROFILE, glfw.OPENGL_CORE_PROFILE)
-
-    glfw.window_hint(glfw.RESIZABLE, glfw.TRUE)
-    window = glfw.create_window(width, height, title, None, None)
-
-    if not window:
-        glfw.terminate()
-        raise Exception("Could not create GLFW window")
-
-    glfw.make_context_current(window)
-    return window
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from shared import imgui_compat as compat  # noqa: E402
+from shared.app_runner import AppRunner, BACKENDS, FrameTimer  # noqa: E402
+from shared.ui_recorder import UIRecorder, first_difference, load_recording, replay  # noqa: E402
 
 
 # -------------------- STATE (global) --------------------
@@ -62,20 +47,7 @@ show_demo_window = False  # if you want to show ImGui's built-in demo (if availa
 
 
 # -------------------- UI RENDER FUNCTIONS --------------------
-def safe_begin(title, *args, **kwargs):
-    """
-    Wrapper around imgui.begin to accept both return patterns:
-    - older bindings: returns bool
-    - newer bindings: returns (bool, open_state)
-    Returns only the is_open boolean to the caller.
-    """
-    res = imgui.begin(title, *args, **kwargs)
-    if isinstance(res, tuple):
-        return res[0]
-    return res
-
-
-def render_menu_bar(window):
+def render_menu_bar(runner):
     """
     Renders a simple main menu bar with File and Edit menus.
     File->Open prints a message; File->Quit will close the window.
@@ -87,7 +59,7 @@ def render_menu_bar(window):
                 print("[Menu] Open requested")
             clicked_quit, _ = imgui.menu_item("Quit", "Alt+F4")
             if clicked_quit:
-                glfw.set_window_should_close(window, True)
+                runner.request_close()
             imgui.end_menu()
 
         if imgui.begin_menu("Edit", True):
@@ -105,16 +77,14 @@ def render_layout_example():
     """
     imgui.begin("Layout Example", True)
 
-    # Columns: 2 columns example
-    try:
-        # Some bindings support imgui.columns; try-catch to be safe
-        imgui.columns(2, "columns_example")
+    # Columns: 2 columns example (support is probed once by the compat layer)
+    if compat.HAS_COLUMNS:
+        compat.columns(2, "columns_example")
         imgui.text("Column 1")
-        imgui.next_column()
+        compat.next_column()
         imgui.text("Column 2")
-        imgui.columns(1)
-    except Exception:
-        # If columns unsupported, fallback to simple text
+        compat.columns(1)
+    else:
         imgui.text("Columns not supported in this binding; fallback shown.")
 
     # Same-line buttons
@@ -129,7 +99,7 @@ def render_layout_example():
     imgui.dummy(0.0, 10.0)
 
     # Child region
-    if imgui.begin_child("child_example", width=200, height=100, border=True):
+    if compat.begin_child("child_example", 200, 100, True):
         imgui.text("Child content")
         imgui.text("More inside child...")
     imgui.end_child()
@@ -176,12 +146,8 @@ def render_controls():
 
     # Text display
     imgui.text("Basic text")
-    # text_colored expects RGBA floats in [0,1]
-    try:
-        imgui.text_colored("Colored text", 1.0, 0.0, 0.0, 1.0)
-    except Exception:
-        # Some wrappers use a different name or signature; ignore if unavailable
-        imgui.text("Colored text (red)")
+    # text_colored expects RGBA floats in [0,1]; falls back to plain text
+    compat.text_colored("Colored text", 1.0, 0.0, 0.0, 1.0)
 
     # Buttons
     if imgui.button("Click me"):
@@ -206,75 +172,121 @@ def render_flags_window():
 
 
 # -------------------- MAIN --------------------
-def main():
-    global show_demo_window
-
-    imgui.create_context()
-    window = initialize_glfw()
-    impl = GlfwRenderer(window)
-
-    # Main loop
-    while not glfw.window_should_close(window):
-        glfw.poll_events()
-        impl.process_inputs()
-
-        # Start new frame
-        imgui.new_frame()
-
-        # Optionally show ImGui's demo (helpful if available)
-        if show_demo_window:
-            try:
-                imgui.show_demo_window()
-            except Exception:
-                pass
-
-        # Render menu bar
-        render_menu_bar(window)
-
-        # Basic example window
-        imgui.begin("Example Window", True)
-        imgui.text("Hello from GLFW + ImGui!")
-        imgui.end()
-
-        # Layout example
-        render_layout_example()
-
-        # Controls
-        render_controls()
-
-        # State example
-        render_state_example()
-
-        # Flags window
-        render_flags_window()
-
-        # Build window_flags based on toggles
-        window_flags = 0
-        if no_titlebar:
-            window_flags |= imgui.WINDOW_NO_TITLE_BAR
-        if no_resize:
-            window_flags |= imgui.WINDOW_NO_RESIZE
-        if no_move:
-            window_flags |= imgui.WINDOW_NO_MOVE
-
-        # Begin a window with flags: safe begin to adapt to binding differences
-        is_open = safe_begin("Window Title (with flags)", True, flags=window_flags)
-        if is_open:
-            imgui.text("Window content (flags applied here).")
-            imgui.text("Toggle flags in the 'Window Flags' window.")
-        imgui.end()
-
-        # refresh & render
-        gl.glClearColor(1.0, 1.0, 1.0, 1.0)
-        gl.glClear(gl.GL_COLOR_BUFFER_BIT)
-
-        imgui.render()
-        impl.render(imgui.get_draw_data())
-        glfw.swap_buffers(window)
-
-    # Close
-    impl.shutdown()
-    glfw.terminate()
+def render_frame(runner):
+    """
+    Builds one full frame of the demo. Called by the runner between
+    new_frame and render.
+    """
+    # Optionally show ImGui's demo (helpful if available)
+    if show_demo_window:
+        compat.show_demo_window()
+
+    # Render menu bar
+    render_menu_bar(runner)
+
+    # Basic example window
+    imgui.begin("Example Window", True)
+    imgui.text("Hello from GLFW + ImGui!")
+    imgui.end()
+
+    # Layout example
+    render_layout_example()
+
+    # Controls
+    render_controls()
+
+    # State example
+    render_state_example()
+
+    # Flags window
+    render_flags_window()
+
+    # Build window_flags based on toggles
+    window_flags = 0
+    if no_titlebar:
+        window_flags |= imgui.WINDOW_NO_TITLE_BAR
+    if no_resize:
+        window_flags |= imgui.WINDOW_NO_RESIZE
+    if no_move:
+        window_flags |= imgui.WINDOW_NO_MOVE
+
+    # Begin a window with flags; compat.begin returns only the expanded state
+    is_open = compat.begin("Window Title (with flags)", True, window_flags)
+    if is_open:
+        imgui.text("Window content (flags applied here).")
+        imgui.text("Toggle flags in the 'Window Flags' window.")
+    imgui.end()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="glfw")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="stop after this many frames (null backend, default 1000)")
+    parser.add_argument("--no-vsync", action="store_true")
+    parser.add_argument("--fps", type=float, default=None, help="target frame rate")
+    parser.add_argument("--idle-timeout", type=float, default=0.5,
+                        help="seconds to wait for input between frames; 0 to spin")
+    parser.add_argument("--timings", action="store_true",
+                        help="print a frame timing summary on exit")
+    parser.add_argument("--record", metavar="PATH",
+                        help="save the input sequence and UI command stream to PATH")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="replay a recording headlessly and compare against it")
+    parser.add_argument("--profile", action="store_true",
+                        help="print per-widget cost on exit")
+    args = parser.parse_args(argv)
+    if args.backend == "null" and args.frames is None:
+        # The null backend has no window to close; always bound the run
+        args.frames = 1000
+    return args
+
+
+def replay_recording(path, profile=False):
+    """
+    Replays a recording headlessly; returns 0 if the UI command stream
+    matches the recorded one, 1 otherwise.
+    """
+    inputs, golden, ini_settings = load_recording(path)
+    recorder = replay(render_frame, inputs, namespaces=(imgui, compat), ini_settings=ini_settings)
+    if profile:
+        print(recorder.stream.format_profile())
+
+    mismatch = first_difference(golden, recorder.stream.golden())
+    if mismatch:
+        index, expected, actual = mismatch
+        print(f"Replay differs at command {index}:\n  expected {expected}\n  actual   {actual}")
+        return 1
+    print(f"Replay matches {len(golden)} commands over {len(inputs)} frames")
+    return 0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.replay:
+        sys.exit(replay_recording(args.replay, args.profile))
+
+    if args.backend == "null":
+        backend = BACKENDS["null"](max_frames=args.frames)
+    else:
+        backend = BACKENDS[args.backend](vsync=not args.no_vsync)
+
+    recorder = (UIRecorder(imgui, compat, capture_values=bool(args.record))
+                if args.record or args.profile else None)
+    timer = FrameTimer() if args.timings or args.backend == "null" else None
+    runner = AppRunner(backend, recorder.wrap(render_frame) if recorder else render_frame,
+                       target_fps=args.fps, idle_timeout=args.idle_timeout or None,
+                       frame_hooks=[timer] if timer else [])
+    with recorder or contextlib.nullcontext():
+        runner.run()
+
+    if timer:
+        print(timer.summary())
+    if args.profile:
+        print(recorder.stream.format_profile())
+    if args.record:
+        recorder.save(args.record)
     sys.exit(0)
 
 
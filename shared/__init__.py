@@ -0,0 +1,3 @@
+"""
+Helpers shared by the example apps in this repository.
+"""
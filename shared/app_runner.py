@@ -0,0 +1,334 @@
+"""
+Reusable ImGui frame loop with pluggable backends.
+
+Backends:
+- GlfwBackend: GLFW window + GlfwRenderer (OpenGL)
+- PygameBackend: pygame window + PygameRenderer (OpenGL)
+- NullBackend: no window and no GL; builds ImGui frames headlessly, for
+  tests and benchmarks on machines without a display
+
+Pacing:
+- vsync: swap interval 1 on the windowed backends
+- target_fps: sleep off the rest of each frame's budget
+- idle_timeout: power-saving mode; block on events for up to this many
+  seconds before building the next frame instead of spinning
+
+Backend modules (glfw, pygame, OpenGL) are imported only by the backend
+that needs them.
+"""
+
+import time
+from collections import namedtuple
+
+import imgui
+
+
+FrameStats = namedtuple("FrameStats", "index events_ms build_ms render_ms frame_ms")
+
+
+def initialize_glfw(width=800, height=600, title="ImGui + GLFW Example"):
+    import glfw
+
+    if not glfw.init():
+        raise Exception("Could not initialize GLFW")
+
+    # Optional: request a core profile context if needed for your GL bindings
+    glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, 3)
+    glfw.window_hint(glfw.CONTEXT_VERSION_MINOR, 3)
+    glfw.window_hint(glfw.OPENGL_PROFILE, glfw.OPENGL_CORE_PROFILE)
+
+    glfw.window_hint(glfw.RESIZABLE, glfw.TRUE)
+    window = glfw.create_window(width, height, title, None, None)
+
+    if not window:
+        glfw.terminate()
+        raise Exception("Could not create GLFW window")
+
+    glfw.make_context_current(window)
+    return window
+
+
+# -------------------- BACKENDS --------------------
+class GlfwBackend:
+    """
+    GLFW window rendered through imgui's GlfwRenderer.
+    """
+    def __init__(self, width=800, height=600, title="ImGui + GLFW Example", vsync=True):
+        self.width = width
+        self.height = height
+        self.title = title
+        self.vsync = vsync
+        self.window = None
+        self.impl = None
+
+    def open(self):
+        import glfw
+        from imgui.integrations.glfw import GlfwRenderer
+
+        self.window = initialize_glfw(self.width, self.height, self.title)
+        glfw.swap_interval(1 if self.vsync else 0)
+        self.impl = GlfwRenderer(self.window)
+
+    def pump_events(self, timeout=None):
+        import glfw
+
+        if timeout:
+            glfw.wait_events_timeout(timeout)
+        else:
+            glfw.poll_events()
+        self.impl.process_inputs()
+
+    def should_close(self):
+        import glfw
+        return glfw.window_should_close(self.window)
+
+    def request_close(self):
+        import glfw
+        glfw.set_window_should_close(self.window, True)
+
+    def present(self, clear_color):
+        import glfw
+        import OpenGL.GL as gl
+
+        gl.glClearColor(*clear_color)
+        gl.glClear(gl.GL_COLOR_BUFFER_BIT)
+        imgui.render()
+        self.impl.render(imgui.get_draw_data())
+        glfw.swap_buffers(self.window)
+
+    def shutdown(self):
+        import glfw
+
+        self.impl.shutdown()
+        glfw.terminate()
+
+
+class PygameBackend:
+    """
+    pygame OpenGL window rendered through imgui's PygameRenderer.
+    """
+    def __init__(self, width=1000, height=750, title="ImGui + Pygame", vsync=True):
+        self.width = width
+        self.height = height
+        self.title = title
+        self.vsync = vsync
+        self.renderer = None
+        self._closing = False
+
+    def open(self):
+        import pygame
+        from pygame.locals import OPENGL, DOUBLEBUF
+        from imgui.integrations.pygame import PygameRenderer
+
+        pygame.init()
+        pygame.display.set_caption(self.title)
+        pygame.display.set_mode((self.width, self.height), OPENGL | DOUBLEBUF,
+                                vsync=1 if self.vsync else 0)
+        self.renderer = PygameRenderer()
+        imgui.get_io().display_size = pygame.display.get_window_size()
+
+    def pump_events(self, timeout=None):
+        import pygame
+
+        if timeout:
+            # Block until the first event (or timeout), then drain the rest
+            first = pygame.event.wait(int(timeout * 1000))
+            events = [first] if first.type != pygame.NOEVENT else []
+            events.extend(pygame.event.get())
+        else:
+            events = pygame.event.get()
+
+        for e in events:
+            if e.type == pygame.QUIT:
+                self._closing = True
+            self.renderer.process_event(e)
+
+        imgui.get_io().display_size = pygame.display.get_window_size()
+        # Sets io.delta_time from the pygame clock; older pyimgui lacks it
+        if hasattr(self.renderer, "process_inputs"):
+            self.renderer.process_inputs()
+
+    def should_close(self):
+        return self._closing
+
+    def request_close(self):
+        self._closing = True
+
+    def present(self, clear_color):
+        import pygame
+        from OpenGL import GL
+
+        GL.glClearColor(*clear_color)
+        GL.glClear(GL.GL_COLOR_BUFFER_BIT)
+        imgui.render()
+        self.renderer.render(imgui.get_draw_data())
+        pygame.display.flip()
+
+    def shutdown(self):
+        import pygame
+        pygame.quit()
+
+
+class NullBackend:
+    """
+    Headless backend: no window, no GL. Frames are built and rendered to
+    ImGui draw data, which is then discarded. Closes after `max_frames`
+    frames when given. `frame_time` is the delta time reported to ImGui.
+    `inputs` is an optional sequence of InputFrames (see shared.ui_recorder)
+    fed to ImGui one per frame; it also bounds the frame count.
+    `ini_settings` is window layout data loaded before the first frame in
+    place of imgui.ini.
+    """
+    def __init__(self, width=800, height=600, max_frames=None, frame_time=1.0 / 60.0, inputs=None,
+                 ini_settings=None):
+        self.width = width
+        self.height = height
+        self.ini_settings = ini_settings
+        self.inputs = list(inputs) if inputs is not None else None
+        if max_frames is None and self.inputs is not None:
+            max_frames = len(self.inputs)
+        self.max_frames = max_frames
+        self.frame_time = frame_time
+        self.frames = 0
+        self._closing = False
+
+    def open(self):
+        io = imgui.get_io()
+        io.display_size = (self.width, self.height)
+        # Build the font atlas; a renderer would normally do this when
+        # uploading the font texture, and new_frame asserts without it.
+        io.fonts.get_tex_data_as_rgba32()
+        # Keep headless runs independent of any saved window layout
+        io.ini_file_name = None
+        if self.ini_settings:
+            imgui.load_ini_settings_from_memory(self.ini_settings)
+
+    def pump_events(self, timeout=None):
+        # No events to wait for; idle waits would only slow benchmarks down
+        io = imgui.get_io()
+        io.delta_time = self.frame_time
+        if self.inputs and self.frames < len(self.inputs):
+            frame = self.inputs[self.frames]
+            io.delta_time = frame.delta_time
+            if frame.display_size:
+                io.display_size = frame.display_size
+            io.mouse_pos = frame.mouse_pos
+            for button, down in enumerate(frame.mouse_down):
+                io.mouse_down[button] = down
+            io.mouse_wheel = frame.wheel
+            for char in frame.chars:
+                io.add_input_character(ord(char))
+
+    def should_close(self):
+        return self._closing or (self.max_frames is not None and self.frames >= self.max_frames)
+
+    def request_close(self):
+        self._closing = True
+
+    def present(self, clear_color):
+        imgui.render()
+        imgui.get_draw_data()
+        self.frames += 1
+
+    def shutdown(self):
+        pass
+
+
+BACKENDS = {
+    "glfw": GlfwBackend,
+    "pygame": PygameBackend,
+    "null": NullBackend,
+}
+
+
+# -------------------- RUNNER --------------------
+class FrameTimer:
+    """
+    Frame hook that keeps running totals of per-frame timings for a
+    summary report. Memory use does not grow with the number of frames.
+    """
+    def __init__(self):
+        self.count = 0
+        self.events_ms = 0.0
+        self.build_ms = 0.0
+        self.render_ms = 0.0
+        self.frame_ms = 0.0
+        self.max_frame_ms = 0.0
+
+    def __call__(self, stats):
+        self.count += 1
+        self.events_ms += stats.events_ms
+        self.build_ms += stats.build_ms
+        self.render_ms += stats.render_ms
+        self.frame_ms += stats.frame_ms
+        self.max_frame_ms = max(self.max_frame_ms, stats.frame_ms)
+
+    def summary(self):
+        if not self.count:
+            return "no frames"
+        n = self.count
+        return (f"{n} frames: frame {self.frame_ms / n:.3f} ms avg ({self.max_frame_ms:.3f} max), "
+                f"events {self.events_ms / n:.3f}, build {self.build_ms / n:.3f}, "
+                f"render {self.render_ms / n:.3f} ms")
+
+
+class AppRunner:
+    """
+    Owns the ImGui context and drives `render_frame(runner)` once per frame
+    on the given backend. Frame hooks are called with a FrameStats after
+    each frame.
+    """
+    def __init__(self, backend, render_frame, target_fps=None, idle_timeout=None,
+                 clear_color=(1.0, 1.0, 1.0, 1.0), frame_hooks=()):
+        self.backend = backend
+        self.render_frame = render_frame
+        self.target_fps = target_fps
+        self.idle_timeout = idle_timeout
+        self.clear_color = clear_color
+        self.frame_hooks = list(frame_hooks)
+        self.frame_index = 0
+
+    def request_close(self):
+        self.backend.request_close()
+
+    def run(self):
+        context = imgui.create_context()
+        try:
+            self.backend.open()
+            try:
+                while not self.backend.should_close():
+                    self._frame()
+            finally:
+                self.backend.shutdown()
+        finally:
+            imgui.destroy_context(context)
+
+    def _frame(self):
+        clock = time.perf_counter
+        budget = 1.0 / self.target_fps if self.target_fps else 0.0
+
+        start = clock()
+        self.backend.pump_events(self.idle_timeout)
+        events_done = clock()
+
+        imgui.new_frame()
+        self.render_frame(self)
+        build_done = clock()
+
+        self.backend.present(self.clear_color)
+        render_done = clock()
+
+        remaining = budget - (render_done - start)
+        if remaining > 0:
+            time.sleep(remaining)
+
+        stats = FrameStats(
+            self.frame_index,
+            (events_done - start) * 1000.0,
+            (build_done - events_done) * 1000.0,
+            (render_done - build_done) * 1000.0,
+            (render_done - start) * 1000.0,
+        )
+        self.frame_index += 1
+        for hook in self.frame_hooks:
+            hook(stats)
@@ -0,0 +1,154 @@
+"""
+pyimgui compatibility layer.
+
+The installed pyimgui version is probed once at import and the call
+signatures that differ between releases are bound to plain functions, so
+the per-frame UI code needs no try/except or isinstance checks:
+
+- begin: bool in 0.x, (expanded, opened) from 1.0  -> returns expanded.
+  The signature is the same in every release, so call imgui.begin
+  directly when the result is unused; the wrapper only costs time there.
+- begin_child: bool before 2.0, _BeginEndChild from 2.0 -> returns visible
+- columns / next_column / set_column_width: HAS_COLUMNS is False when the
+  legacy columns API is missing; callers branch on it once
+- text_colored: falls back to plain text when unavailable
+- show_demo_window: no-op when unavailable
+
+Everything else should be called on imgui directly.
+
+Run `python -m shared.imgui_compat` from the repository root for an
+overhead benchmark against direct imgui calls.
+"""
+
+import imgui
+
+from shared.version import parse_version
+
+
+IMGUI_VERSION = tuple(getattr(imgui, "VERSION", ())) or parse_version(getattr(imgui, "__version__", "0"))
+
+HAS_COLUMNS = all(hasattr(imgui, name) for name in ("columns", "next_column", "set_column_width"))
+HAS_TEXT_COLORED = hasattr(imgui, "text_colored")
+HAS_DEMO_WINDOW = hasattr(imgui, "show_demo_window")
+
+
+# -------------------- DISPATCH TABLE --------------------
+_imgui_begin = imgui.begin
+_imgui_begin_child = imgui.begin_child
+
+if IMGUI_VERSION >= (1, 0, 0):
+    def begin(label, closable=False, flags=0):
+        """Begins a window and returns whether it is expanded."""
+        return _imgui_begin(label, closable, flags)[0]
+else:
+    def begin(label, closable=False, flags=0):
+        """Begins a window and returns whether it is expanded."""
+        return _imgui_begin(label, closable, flags)
+
+if IMGUI_VERSION >= (2, 0, 0):
+    def begin_child(label, width=0, height=0, border=False, flags=0):
+        """Begins a child region and returns whether it is visible."""
+        return _imgui_begin_child(label, width, height, border, flags).visible
+else:
+    begin_child = _imgui_begin_child
+
+if HAS_COLUMNS:
+    columns = imgui.columns
+    next_column = imgui.next_column
+    set_column_width = imgui.set_column_width
+else:
+    def columns(count=1, identifier=None, border=True):
+        pass
+
+    def next_column():
+        pass
+
+    def set_column_width(column_index, width):
+        pass
+
+if HAS_TEXT_COLORED:
+    text_colored = imgui.text_colored
+else:
+    def text_colored(text, r, g, b, a=1.0):
+        imgui.text(text)
+
+if HAS_DEMO_WINDOW:
+    show_demo_window = imgui.show_demo_window
+else:
+    def show_demo_window(closable=False):
+        pass
+
+
+# -------------------- BENCHMARK --------------------
+def _benchmark(frames=2000, calls_per_frame=50):
+    """
+    Times compat calls against the direct imgui calls they wrap, inside
+    headless frames. Prints microseconds per call.
+    """
+    import time
+
+    context = imgui.create_context()
+    io = imgui.get_io()
+    io.display_size = (800, 600)
+    io.fonts.get_tex_data_as_rgba32()
+    io.ini_file_name = None
+
+    def run(label, body):
+        best = float("inf")
+        for _ in range(3):
+            elapsed = 0.0
+            for _ in range(frames // 3):
+                io.delta_time = 1.0 / 60.0
+                imgui.new_frame()
+                start = time.perf_counter()
+                body()
+                elapsed += time.perf_counter() - start
+                imgui.render()
+            best = min(best, elapsed)
+        per_call = best / ((frames // 3) * calls_per_frame) * 1e6
+        print(f"{label:<32} {per_call:8.3f} us/call")
+
+    def direct_begin():
+        for _ in range(calls_per_frame):
+            imgui.begin("bench")
+            imgui.end()
+
+    def isinstance_begin():
+        for _ in range(calls_per_frame):
+            res = imgui.begin("bench")
+            if isinstance(res, tuple):
+                res = res[0]
+            imgui.end()
+
+    def compat_begin():
+        for _ in range(calls_per_frame):
+            begin("bench")
+            imgui.end()
+
+    def try_text_colored():
+        imgui.begin("bench")
+        for _ in range(calls_per_frame):
+            try:
+                imgui.text_colored("colored", 1.0, 0.0, 0.0, 1.0)
+            except Exception:
+                imgui.text("colored")
+        imgui.end()
+
+    def compat_text_colored():
+        imgui.begin("bench")
+        for _ in range(calls_per_frame):
+            text_colored("colored", 1.0, 0.0, 0.0, 1.0)
+        imgui.end()
+
+    print(f"pyimgui {'.'.join(map(str, IMGUI_VERSION))}")
+    run("imgui.begin (direct)", direct_begin)
+    run("imgui.begin (isinstance check)", isinstance_begin)
+    run("begin (compat)", compat_begin)
+    run("text_colored (try/except)", try_text_colored)
+    run("text_colored (compat)", compat_text_colored)
+
+    imgui.destroy_context(context)
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,275 @@
+"""
+UI command recorder and headless replay.
+
+UIRecorder wraps the callables of one or more namespaces (the imgui
+module, shared.imgui_compat, ...) while it is active. Every call made by
+immediate-mode render functions is logged to a CommandStream: frame,
+widget kind, widget id (the label, when the first argument is a string),
+arguments, result and duration. The stream is array-backed: kinds, ids
+and the JSON-encoded arguments and results are interned, so a long
+session stays compact. Profiling alone needs no arguments or results;
+pass capture_values=False to skip them.
+
+The recorder also captures one InputFrame (mouse position, buttons,
+wheel, delta time, display size) per frame, plus the window layout
+settings in effect when recording started (what imgui.ini loaded).
+replay() feeds a recorded input sequence back into a render function on
+the headless NullBackend with the same layout, which gives golden-output
+regression checks and per-widget cost profiles without a display or GPU.
+
+Typed characters are not visible through ImGui's IO, so captured
+InputFrames have empty `chars`; hand-written sequences may set them.
+"""
+
+import json
+import time
+from array import array
+from collections import namedtuple
+
+import imgui
+
+from shared.app_runner import AppRunner, NullBackend
+
+
+InputFrame = namedtuple("InputFrame", "mouse_pos mouse_down wheel chars delta_time display_size",
+                        defaults=(1.0 / 60.0, None))
+Command = namedtuple("Command", "frame kind id args result duration_ms")
+
+# Context and frame management calls; not widgets, never recorded
+_UNRECORDED = frozenset((
+    "create_context", "destroy_context", "get_current_context", "set_current_context",
+    "get_io", "get_style", "new_frame", "end_frame", "render", "get_draw_data",
+    "load_ini_settings_from_memory", "save_ini_settings_to_memory",
+    "load_ini_settings_from_disk", "save_ini_settings_to_disk",
+))
+
+
+def _freeze(value):
+    """
+    Reduces call arguments and results to JSON-friendly values that are
+    stable between runs.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (tuple, list)):
+        return [_freeze(v) for v in value]
+    if hasattr(value, "__len__"):
+        # Buffers such as numpy arrays: keep the shape, not the contents
+        return [type(value).__name__, len(value)]
+    return repr(value)
+
+
+# -------------------- COMMAND STREAM --------------------
+class CommandStream:
+    """
+    Compact log of recorded UI calls.
+    """
+    def __init__(self):
+        self._strings = []
+        self._string_index = {}
+        self.frames = array("I")
+        self.kinds = array("I")
+        self.ids = array("I")
+        self.durations = array("d")
+        self.args = array("I")
+        self.results = array("I")
+
+    def _intern(self, text):
+        index = self._string_index.get(text)
+        if index is None:
+            index = self._string_index[text] = len(self._strings)
+            self._strings.append(text)
+        return index
+
+    def append(self, frame, kind, widget_id, args, result, duration):
+        """
+        Logs one call. `args` and `result` are JSON strings.
+        """
+        self.frames.append(frame)
+        self.kinds.append(self._intern(kind))
+        self.ids.append(self._intern(widget_id))
+        self.durations.append(duration)
+        self.args.append(self._intern(args))
+        self.results.append(self._intern(result))
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __iter__(self):
+        strings = self._strings
+        for i in range(len(self.frames)):
+            yield Command(self.frames[i], strings[self.kinds[i]], strings[self.ids[i]],
+                          json.loads(strings[self.args[i]]), json.loads(strings[self.results[i]]),
+                          self.durations[i] * 1000.0)
+
+    def golden(self):
+        """
+        Returns the stream without timings, for regression comparisons.
+        """
+        return [[c.frame, c.kind, c.id, c.args, c.result] for c in self]
+
+    def profile(self):
+        """
+        Returns (kind, id, calls, total_ms, mean_ms) per widget, costliest first.
+        """
+        totals = {}
+        for kind, widget_id, duration in zip(self.kinds, self.ids, self.durations):
+            entry = totals.setdefault((kind, widget_id), [0, 0.0])
+            entry[0] += 1
+            entry[1] += duration
+        rows = [(self._strings[k], self._strings[i], calls, total * 1000.0, total * 1000.0 / calls)
+                for (k, i), (calls, total) in totals.items()]
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows
+
+    def format_profile(self, limit=20):
+        lines = [f"{'kind':<24} {'id':<32} {'calls':>7} {'total ms':>10} {'mean us':>9}"]
+        for kind, widget_id, calls, total_ms, mean_ms in self.profile()[:limit]:
+            lines.append(f"{kind:<24} {widget_id[:32]:<32} {calls:>7} {total_ms:>10.3f} {mean_ms * 1000.0:>9.2f}")
+        return "\n".join(lines)
+
+
+# -------------------- RECORDER --------------------
+class UIRecorder:
+    """
+    Records UI calls made through `namespaces` while active:
+
+        recorder = UIRecorder(imgui, compat)
+        with recorder:
+            AppRunner(backend, recorder.wrap(render_frame)).run()
+    """
+    def __init__(self, *namespaces, capture_inputs=True, capture_values=True):
+        self.namespaces = namespaces or (imgui,)
+        self.capture_inputs = capture_inputs
+        self.capture_values = capture_values
+        self.stream = CommandStream()
+        self.inputs = []
+        self.ini_settings = None
+        self.frame = 0
+        self._originals = []
+
+    def _wrap_call(self, kind, func):
+        stream = self.stream
+        clock = time.perf_counter
+        encode = json.JSONEncoder(separators=(",", ":")).encode
+        capture_values = self.capture_values
+
+        def recorded(*args, **kwargs):
+            start = clock()
+            result = func(*args, **kwargs)
+            duration = clock() - start
+            widget_id = args[0] if args and isinstance(args[0], str) else ""
+            if capture_values:
+                call_args = list(args)
+                if kwargs:
+                    call_args.append(dict(sorted(kwargs.items())))
+                stream.append(self.frame, kind, widget_id, encode(_freeze(call_args)),
+                              encode(_freeze(result)), duration)
+            else:
+                stream.append(self.frame, kind, widget_id, "null", "null", duration)
+            return result
+
+        return recorded
+
+    def __enter__(self):
+        for namespace in self.namespaces:
+            for name, value in list(vars(namespace).items()):
+                if name.startswith("_") or name in _UNRECORDED:
+                    continue
+                if not callable(value) or isinstance(value, type):
+                    continue
+                self._originals.append((namespace, name, value))
+                setattr(namespace, name, self._wrap_call(name, value))
+        return self
+
+    def __exit__(self, *exc_info):
+        while self._originals:
+            namespace, name, value = self._originals.pop()
+            setattr(namespace, name, value)
+        return False
+
+    def wrap(self, render_frame):
+        """
+        Returns a render function that tags calls with the frame index and
+        captures the frame's input before building it.
+        """
+        def recorded_frame(runner):
+            self.frame = runner.frame_index
+            if self.capture_inputs:
+                io = imgui.get_io()
+                if self.ini_settings is None:
+                    # The first new_frame has loaded imgui.ini; keep that layout
+                    self.ini_settings = imgui.save_ini_settings_to_memory()
+                self.inputs.append(InputFrame(
+                    tuple(io.mouse_pos),
+                    tuple(bool(down) for down in io.mouse_down[:3]),
+                    io.mouse_wheel,
+                    "",
+                    io.delta_time,
+                    tuple(io.display_size),
+                ))
+            render_frame(runner)
+
+        return recorded_frame
+
+    def save(self, path):
+        """
+        Writes the input sequence, layout settings and golden command
+        stream as JSON.
+        """
+        with open(path, "w") as f:
+            json.dump({
+                "ini_settings": self.ini_settings or "",
+                "inputs": [list(frame) for frame in self.inputs],
+                "commands": self.stream.golden(),
+            }, f)
+
+
+def _input_frame(fields):
+    frame = InputFrame(*fields)
+    return frame._replace(
+        mouse_pos=tuple(frame.mouse_pos),
+        mouse_down=tuple(frame.mouse_down),
+        display_size=tuple(frame.display_size) if frame.display_size else None,
+    )
+
+
+def load_recording(path):
+    """
+    Returns (inputs, golden commands, ini settings) from a file written by
+    UIRecorder.save.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    inputs = [_input_frame(fields) for fields in data["inputs"]]
+    return inputs, data["commands"], data.get("ini_settings", "")
+
+
+# -------------------- REPLAY --------------------
+def replay(render_frame, inputs, namespaces=(), width=800, height=600, ini_settings=None):
+    """
+    Runs `render_frame` headlessly once per input frame and returns the
+    UIRecorder holding the resulting command stream. Pass the recording's
+    `ini_settings` so windows start where they were when it was made.
+    """
+    backend = NullBackend(width, height, inputs=inputs, ini_settings=ini_settings)
+    recorder = UIRecorder(*namespaces, capture_inputs=False)
+    with recorder:
+        AppRunner(backend, recorder.wrap(render_frame)).run()
+    return recorder
+
+
+def first_difference(golden, commands):
+    """
+    Returns (index, expected, actual) for the first mismatching command,
+    or None when both streams are identical.
+    """
+    for index, (expected, actual) in enumerate(zip(golden, commands)):
+        if expected != actual:
+            return index, expected, actual
+    if len(golden) != len(commands):
+        index = min(len(golden), len(commands))
+        expected = golden[index] if index < len(golden) else None
+        actual = commands[index] if index < len(commands) else None
+        return index, expected, actual
+    return None
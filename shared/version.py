@@ -0,0 +1,15 @@
+"""
+Version helpers for the binding compatibility layers.
+"""
+
+
+def parse_version(version):
+    """
+    Turns a version string such as "2.0.0" or "1.10.1rc2" into a
+    comparable (major, minor, patch) tuple.
+    """
+    parts = []
+    for piece in str(version).split(".")[:3]:
+        digits = "".join(ch for ch in piece if ch.isdigit())
+        parts.append(int(digits) if digits else 0)
+    return tuple(parts + [0] * (3 - len(parts)))
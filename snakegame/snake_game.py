@@ -1,7 +1,9 @@
+import dearpygui
 import dearpygui.dearpygui as dpg
 import time
 import random
-from threading import Thread
+from collections import deque, namedtuple
+from threading import Lock, Thread
 
 # --- Game settings ---
 GRID_WIDTH = 20
@@ -10,6 +12,24 @@ CELL_SIZE = 25
 UPDATE_INTERVAL = 0.25  # Initial speed
 MIN_INTERVAL = 0.05
 MAX_INTERVAL = 0.5
+MAX_QUEUED_TURNS = 3    # Turns buffered between ticks
+MAX_CATCH_UP_STEPS = 3  # Missed ticks replayed before the rest are dropped
+TICK_POLICY = "catch_up"  # "catch_up" or "drop"
+
+# --- Binding differences (probed once at import) ---
+# Key handlers report virtual-key codes in 1.x and ImGuiKey values in 2.x
+KEY_W = getattr(dpg, "mvKey_W", ord("W"))
+KEY_A = getattr(dpg, "mvKey_A", ord("A"))
+KEY_S = getattr(dpg, "mvKey_S", ord("S"))
+KEY_D = getattr(dpg, "mvKey_D", ord("D"))
+
+# Key-down handlers receive the key in 0.x and [key, seconds_held] from 1.0
+if int(dearpygui.__version__.split(".")[0]) >= 1:
+    def key_down_code(app_data):
+        return app_data[0]
+else:
+    def key_down_code(app_data):
+        return app_data
 
 # --- Game state ---
 snake = [(5, 5)]
@@ -19,15 +39,120 @@ score = 0
 game_over = False
 game_running = True
 
+# Guards the game state above; taken by the tick thread and UI callbacks
+state_lock = Lock()
+# Pending turns, applied one per tick so quick presses are not lost
+turn_queue = deque()
+
+# --- Frame hand-off ---
+Frame = namedtuple("Frame", "seq snake food score game_over")
+
+class FrameBuffer:
+    """
+    Double buffer between the tick thread and the UI thread.
+    The tick thread publishes immutable snapshots; the UI thread takes the
+    newest one (or None if nothing changed since the last take).
+    """
+    def __init__(self):
+        self._lock = Lock()
+        self._pending = None
+        self._seq = 0
+
+    def publish(self, snake, food, score, game_over):
+        with self._lock:
+            self._seq += 1
+            self._pending = Frame(self._seq, tuple(snake), food, score, game_over)
+
+    def take(self):
+        with self._lock:
+            frame, self._pending = self._pending, None
+        return frame
+
+frame_buffer = FrameBuffer()
+
+# --- Fixed-timestep scheduler ---
+class FixedStepScheduler:
+    """
+    Calls `step` every `interval` seconds on a monotonic clock.
+    Ticks are scheduled against absolute deadlines so the period does not
+    drift with the cost of `step`. When the loop falls behind, the
+    "catch_up" policy replays up to `max_catch_up` missed ticks back to back
+    and drops the rest; the "drop" policy skips all missed ticks.
+    """
+    def __init__(self, step, interval, policy="catch_up", max_catch_up=3,
+                 clock=time.monotonic, sleep=time.sleep):
+        if policy not in ("catch_up", "drop"):
+            raise ValueError(f"Unknown tick policy: {policy!r}")
+        self.step = step
+        self.interval = interval
+        self.policy = policy
+        self.max_catch_up = max_catch_up
+        self._clock = clock
+        self._sleep = sleep
+        self._stats_lock = Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._ticks = 0
+            self._wakeups = 0
+            self._dropped = 0
+            self._late_sum = 0.0
+            self._late_max = 0.0
+
+    def stats(self):
+        """
+        Returns ticks run, ticks dropped, and mean/max wake-up lateness in ms.
+        """
+        with self._stats_lock:
+            mean = self._late_sum / self._wakeups if self._wakeups else 0.0
+            return {
+                "ticks": self._ticks,
+                "dropped": self._dropped,
+                "jitter_mean_ms": mean * 1000.0,
+                "jitter_max_ms": self._late_max * 1000.0,
+            }
+
+    def run(self, keep_running):
+        next_tick = self._clock() + self.interval
+        while keep_running():
+            now = self._clock()
+            if now < next_tick:
+                self._sleep(next_tick - now)
+                continue
+
+            late = now - next_tick
+            missed = int(late // self.interval)
+            if self.policy == "drop":
+                replay, dropped = 0, missed
+            else:
+                replay = min(missed, self.max_catch_up)
+                dropped = missed - replay
+            next_tick += dropped * self.interval
+
+            with self._stats_lock:
+                self._ticks += replay + 1
+                self._wakeups += 1
+                self._dropped += dropped
+                self._late_sum += late
+                self._late_max = max(self._late_max, late)
+
+            for _ in range(replay + 1):
+                self.step()
+                next_tick += self.interval
+
 # --- Helper functions ---
 def reset_game():
     global snake, direction, food, score, game_over, game_running
-    snake = [(5, 5)]
-    direction = (1, 0)
-    food = (random.randint(0, GRID_WIDTH-1), random.randint(0, GRID_HEIGHT-1))
-    score = 0
-    game_over = False
-    game_running = True
+    with state_lock:
+        snake = [(5, 5)]
+        direction = (1, 0)
+        food = (random.randint(0, GRID_WIDTH-1), random.randint(0, GRID_HEIGHT-1))
+        score = 0
+        game_over = False
+        game_running = True
+        turn_queue.clear()
+        frame_buffer.publish(snake, food, score, game_over)
 
 def move_snake():
     global snake, food, score, game_over
@@ -43,8 +168,6 @@ def move_snake():
         not (0 <= new_head[0] < GRID_WIDTH) or 
         not (0 <= new_head[1] < GRID_HEIGHT)):
         game_over = True
-        dpg.configure_item("end_game_popup", show=True)
-        dpg.set_value("final_score", f"Score: {score}")
         return
 
     snake.append(new_head)
@@ -64,70 +187,103 @@ def place_food():
             break
 
 # --- Direction handlers ---
+def queue_turn(new_direction):
+    """
+    Queues a turn for a later tick. Turns are checked against the last
+    queued direction, so no-ops, reversals and held keys are ignored.
+    """
+    with state_lock:
+        last = turn_queue[-1] if turn_queue else direction
+        if new_direction == last or new_direction == (-last[0], -last[1]):
+            return
+        if len(turn_queue) < MAX_QUEUED_TURNS:
+            turn_queue.append(new_direction)
+
 def go_up():
-    global direction
-    if direction != (0, 1):
-        direction = (0, -1)
+    queue_turn((0, -1))
 
 def go_down():
-    global direction
-    if direction != (0, -1):
-        direction = (0, 1)
+    queue_turn((0, 1))
 
 def go_left():
-    global direction
-    if direction != (1, 0):
-        direction = (-1, 0)
+    queue_turn((-1, 0))
 
 def go_right():
-    global direction
-    if direction != (-1, 0):
-        direction = (1, 0)
+    queue_turn((1, 0))
 
 # --- Key handler for WSAD ---
+KEY_TURNS = {
+    KEY_W: go_up,
+    KEY_S: go_down,
+    KEY_A: go_left,
+    KEY_D: go_right,
+}
+
 def key_down_handler(sender, app_data):
-    if app_data == 87:  # W
-        go_up()
-    elif app_data == 83:  # S
-        go_down()
-    elif app_data == 65:  # A
-        go_left()
-    elif app_data == 68:  # D
-        go_right()
+    turn = KEY_TURNS.get(key_down_code(app_data))
+    if turn:
+        turn()
 
 # --- Adjust speed via slider ---
 def adjust_speed(sender, app_data):
-    global UPDATE_INTERVAL
-    UPDATE_INTERVAL = MAX_INTERVAL - app_data * (MAX_INTERVAL - MIN_INTERVAL)
+    scheduler.interval = MAX_INTERVAL - app_data * (MAX_INTERVAL - MIN_INTERVAL)
 
-# --- GUI drawing ---
-def draw_game():
+# --- GUI drawing (UI thread only) ---
+def draw_game(frame):
     dpg.delete_item("game_canvas", children_only=True)
 
     dpg.draw_rectangle((0,0),(GRID_WIDTH*CELL_SIZE, GRID_HEIGHT*CELL_SIZE),
                        color=(255,255,0,255), thickness=3, parent="game_canvas")
     
-    for i, (x, y) in enumerate(snake):
-        color = (0, 255, 0, 255) if i < len(snake)-1 else (0, 150, 255, 255)
+    for i, (x, y) in enumerate(frame.snake):
+        color = (0, 255, 0, 255) if i < len(frame.snake)-1 else (0, 150, 255, 255)
         dpg.draw_rectangle((x*CELL_SIZE, y*CELL_SIZE),
                            ((x+1)*CELL_SIZE, (y+1)*CELL_SIZE),
                            color=color, fill=color, parent="game_canvas")
     
-    fx, fy = food
+    fx, fy = frame.food
     dpg.draw_rectangle((fx*CELL_SIZE, fy*CELL_SIZE),
                        ((fx+1)*CELL_SIZE, (fy+1)*CELL_SIZE),
                        color=(255,0,0,255), fill=(255,0,0,255),
                        parent="game_canvas")
     
-    dpg.set_value("score_text", f"Score: {score}")
+    dpg.set_value("score_text", f"Score: {frame.score}")
+
+def render_pending_frame():
+    """
+    Draws the newest published frame, if any, and refreshes tick stats.
+    Called from the UI thread before each rendered frame.
+    """
+    frame = frame_buffer.take()
+    if frame is None:
+        return
+
+    draw_game(frame)
+    if frame.game_over and not dpg.is_item_shown("end_game_popup"):
+        dpg.set_value("final_score", f"Score: {frame.score}")
+        dpg.configure_item("end_game_popup", show=True)
+
+    stats = scheduler.stats()
+    dpg.set_value("tick_stats",
+                  f"Tick jitter: {stats['jitter_mean_ms']:.1f} ms avg, "
+                  f"{stats['jitter_max_ms']:.1f} ms max, {stats['dropped']} dropped")
 
 # --- Game loop ---
+def game_tick():
+    global direction
+    with state_lock:
+        if not game_running or game_over:
+            return
+        if turn_queue:
+            direction = turn_queue.popleft()
+        move_snake()
+        frame_buffer.publish(snake, food, score, game_over)
+
 def game_loop():
-    while dpg.is_dearpygui_running():
-        if game_running:
-            move_snake()
-            draw_game()
-        time.sleep(UPDATE_INTERVAL)
+    scheduler.run(dpg.is_dearpygui_running)
+
+scheduler = FixedStepScheduler(game_tick, UPDATE_INTERVAL,
+                               policy=TICK_POLICY, max_catch_up=MAX_CATCH_UP_STEPS)
 
 # --- Menu actions ---
 def menu_refresh():
@@ -192,6 +348,7 @@ with dpg.window(label="Snake Game", tag="game_window"):
             dpg.add_slider_float(label="", default_value=0.5, min_value=0, max_value=1, width=100, callback=adjust_speed)
 
     dpg.add_text("Score: 0", tag="score_text")
+    dpg.add_text("", tag="tick_stats")
 
 # --- Key handler registry ---
 with dpg.handler_registry():
@@ -221,6 +378,11 @@ dpg.setup_dearpygui()
 dpg.show_viewport()
 dpg.focus_item("game_window")
 
+frame_buffer.publish(snake, food, score, game_over)
 Thread(target=game_loop, daemon=True).start()
-dpg.start_dearpygui()
+
+# Manual render loop so frames from the tick thread are drawn on the UI thread
+while dpg.is_dearpygui_running():
+    render_pending_frame()
+    dpg.render_dearpygui_frame()
 dpg.destroy_context()